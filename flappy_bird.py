@@ -8,7 +8,7 @@ from typing import Optional
 
 import pygame
 
-from ui_common import draw_game_over_ui
+from ui_common import draw_game_over_ui, render_text
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 540
@@ -149,6 +149,8 @@ class FlappyBirdGame:
         self.obstacle_head_down: Optional[pygame.Surface] = None
         self.obstacle_body: Optional[pygame.Surface] = None
         self._load_assets()
+        # 폴백 도형 새는 모양이 고정이라 한 번만 그려 두고, 매 프레임 회전만 한다.
+        self._fallback_bird_surface = self._build_fallback_bird_surface()
 
         self.reset_run()
         btn_w, btn_h = 240, 64
@@ -479,6 +481,11 @@ class FlappyBirdGame:
             return
 
         # 폴백: 간단한 도형 새
+        rotated = pygame.transform.rotate(self._fallback_bird_surface, angle)
+        r = rotated.get_rect(center=(cx, cy))
+        self.screen.blit(rotated, r)
+
+    def _build_fallback_bird_surface(self) -> pygame.Surface:
         body = pygame.Surface((BIRD_SIZE + 10, BIRD_SIZE + 10), pygame.SRCALPHA)
         pygame.draw.circle(body, (255, 220, 60), (BIRD_SIZE // 2 + 5, BIRD_SIZE // 2 + 5), BIRD_SIZE // 2)
         pygame.draw.circle(body, (40, 40, 40), (BIRD_SIZE // 2 + 10, BIRD_SIZE // 2 - 5), 3)  # 눈
@@ -491,31 +498,29 @@ class FlappyBirdGame:
                 (BIRD_SIZE // 2 + 18, BIRD_SIZE // 2 + 14),
             ],
         )
-        rotated = pygame.transform.rotate(body, angle)
-        r = rotated.get_rect(center=(cx, cy))
-        self.screen.blit(rotated, r)
+        return body
 
     def draw_score(self) -> None:
-        rendered = self.font_big.render(str(self.score), True, (30, 30, 30))
+        rendered = render_text(self.font_big, str(self.score), (30, 30, 30))
         rect = rendered.get_rect(center=(SCREEN_WIDTH // 2, 130))
         self.screen.blit(rendered, rect)
 
     def draw_title(self) -> None:
         self.draw_background()
         self.draw_ground()
-        title = self.font_title.render("날아부리", True, (20, 20, 20))
+        title = render_text(self.font_title, "날아부리", (20, 20, 20))
         # 다른 게임(쌓아부리/모아부리)과 동일하게: 타이틀/설명은 위쪽에 두고 버튼과 충분한 간격을 확보
         self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 150)))
-        subtitle = self.font.render("뱀을 요리조리 피해보자!!", True, (60, 60, 60))
+        subtitle = render_text(self.font, "뱀을 요리조리 피해보자!!", (60, 60, 60))
         self.screen.blit(subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, 195)))
 
         for idx, (rect, label) in enumerate([(self.btn_start, "게임시작"), (self.btn_howto, "게임방법")]):
             _draw_card(self.screen, rect)
             text_color = (20, 20, 20) if idx == self.menu_index else (90, 90, 90)
-            rendered = self.font.render(label, True, text_color)
+            rendered = render_text(self.font, label, text_color)
             self.screen.blit(rendered, rendered.get_rect(center=rect.center))
         # 다른 게임과 동일하게 하단 중앙에 안내 문구 배치
-        esc = self.font_small.render("ESC: 종료", True, (70, 70, 70))
+        esc = render_text(self.font_small, "ESC: 종료", (70, 70, 70))
         self.screen.blit(esc, esc.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 26)))
         # 미리보기 새
         self.draw_bird()
@@ -523,7 +528,7 @@ class FlappyBirdGame:
     def draw_howto(self) -> None:
         self.draw_background()
         self.draw_ground()
-        title = self.font_title.render("게임방법", True, (20, 20, 20))
+        title = render_text(self.font_title, "게임방법", (20, 20, 20))
         # 세 게임 공통 게임방법 레이아웃
         self.screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 120)))
 
@@ -541,12 +546,12 @@ class FlappyBirdGame:
             if line == "":
                 y += 12
                 continue
-            surf = self.font.render(line, True, (50, 50, 50))
+            surf = render_text(self.font, line, (50, 50, 50))
             self.screen.blit(surf, surf.get_rect(center=(card.centerx, y)))
             y += 34
 
         _draw_card(self.screen, self.btn_back)
-        back = self.font.render("뒤로", True, (20, 20, 20))
+        back = render_text(self.font, "뒤로", (20, 20, 20))
         self.screen.blit(back, back.get_rect(center=self.btn_back.center))
 
     def draw_play(self) -> None:
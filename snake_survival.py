@@ -8,7 +8,7 @@ from typing import Deque, Dict, List, Optional, Tuple
 
 import pygame
 
-from ui_common import draw_game_over_ui
+from ui_common import draw_game_over_ui, render_text
 
 # 요청: 캐릭터/음식 등을 더 크게 보이게(20x20 → 30x30 느낌)
 # 화면(800x540, HUD 60)을 벗어나지 않도록 그리드 크기도 함께 조정한다.
@@ -63,6 +63,8 @@ CORNER_TO_INDEX: Dict[frozenset[Direction], int] = {
     frozenset({LEFT, UP}): 5,
 }
 SPARK_FRAME_DURATION = 0.06
+# 먹이 위치 후보(격자 전체 칸). 먹이를 놓을 때마다 새로 만들지 않도록 한 번만 만든다.
+ALL_CELLS: frozenset[Tuple[int, int]] = frozenset((x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT))
 
 Direction = Tuple[int, int]
 Point = Tuple[int, int]
@@ -217,11 +219,7 @@ def direction_between(a: Point, b: Point) -> Direction:
     return (b[0] - a[0], b[1] - a[1])
 
 
-def body_frame_index(prev_segment: Point, current: Point, next_segment: Point) -> int:
-    """Determine which body sprite frame fits a middle snake segment."""
-    prev_dir = direction_between(current, prev_segment)
-    next_dir = direction_between(current, next_segment)
-
+def _classify_body_frame(prev_dir: Direction, next_dir: Direction) -> int:
     if prev_dir[0] == -next_dir[0] and prev_dir[0] != 0:
         return 0  # horizontal
     if prev_dir[1] == -next_dir[1] and prev_dir[1] != 0:
@@ -230,18 +228,55 @@ def body_frame_index(prev_segment: Point, current: Point, next_segment: Point) -
     return CORNER_TO_INDEX.get(frozenset({prev_dir, next_dir}), 0)
 
 
+# 몸통 세그먼트의 (앞 방향, 뒤 방향) 조합은 4×4가 전부이므로, 프레임 번호를 import 시점에 표로 만들어 둔다.
+# (매 프레임 세그먼트마다 frozenset을 만들어 비교하지 않도록)
+BODY_FRAME_BY_DIRS: Dict[Tuple[Direction, Direction], int] = {
+    (prev_dir, next_dir): _classify_body_frame(prev_dir, next_dir)
+    for prev_dir in DIRECTION_TO_INDEX
+    for next_dir in DIRECTION_TO_INDEX
+}
+
+
+def body_frame_index(prev_segment: Point, current: Point, next_segment: Point) -> int:
+    """Determine which body sprite frame fits a middle snake segment."""
+    prev_dir = direction_between(current, prev_segment)
+    next_dir = direction_between(current, next_segment)
+    frame_idx = BODY_FRAME_BY_DIRS.get((prev_dir, next_dir))
+    if frame_idx is None:
+        return _classify_body_frame(prev_dir, next_dir)
+    return frame_idx
+
+
 def create_food(snake: List[Point]) -> Point:
     """Return a random grid cell that does not overlap with the snake."""
-    available = {(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)} - set(snake)
+    available = ALL_CELLS - set(snake)
     if not available:
         return snake[-1]
     return random.choice(tuple(available))
 
 
+# 배경 타일 + 격자 오버레이는 매 프레임 같으므로, (타일, 오버레이) 조합별로 한 화면짜리 Surface에 한 번만 합성해 둔다.
+_background_cache: Dict[Tuple[pygame.Surface, pygame.Surface], pygame.Surface] = {}
+
+
 def draw_background(
     surface: pygame.Surface, background_tile: pygame.Surface, grid_overlay: pygame.Surface
 ) -> None:
     """Render the textured background and apply the grid overlay pattern."""
+    key = (background_tile, grid_overlay)
+    baked = _background_cache.get(key)
+    if baked is None:
+        baked = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        _compose_background(baked, background_tile, grid_overlay)
+        # 런처에서 다시 들어올 때마다 에셋을 새로 읽으므로, 이전 판의 합성본은 버린다.
+        _background_cache.clear()
+        _background_cache[key] = baked
+    surface.blit(baked, (0, 0))
+
+
+def _compose_background(
+    surface: pygame.Surface, background_tile: pygame.Surface, grid_overlay: pygame.Surface
+) -> None:
     surface.fill(BACKGROUND_COLOR)
     # If the background asset is a full-screen image, blit once; otherwise tile it.
     if background_tile.get_width() >= SCREEN_WIDTH and background_tile.get_height() >= SCREEN_HEIGHT:
@@ -277,48 +312,61 @@ def draw_snake(
     """Draw the snake using sprite assets for head, body, and tail."""
     shadow_offset_x = (CELL_SIZE - shadow.get_width()) // 2
     shadow_offset_y = CELL_SIZE - shadow.get_height()
+    # 세그먼트마다 blit을 부르지 않고 (surface, 좌표) 목록을 모아 blits 한 번으로 그린다.
+    # (목록 순서 = 그리는 순서: 세그먼트마다 그림자 → 스프라이트)
+    draws: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+    # 세그먼트마다 반복되는 전역/길이 조회는 루프 밖에서 한 번만 한다.
+    direction_to_index = DIRECTION_TO_INDEX
+    default_index = direction_to_index[RIGHT]
+    last_idx = len(snake) - 1
+    friend_count = len(friend_kinds) if friend_head_frames and friend_kinds else 0
+    friend_sheet_count = len(friend_head_frames) if friend_head_frames else 0
+    directional_tail = len(tail_frames) >= 4
+    directional_body = len(body_frames) >= 6
 
     for idx, segment in enumerate(snake):
         pixel = (
             PLAYFIELD_OFFSET_X + segment[0] * CELL_SIZE,
             PLAYFIELD_OFFSET_Y + segment[1] * CELL_SIZE,
         )
-        surface.blit(shadow, (pixel[0] + shadow_offset_x, pixel[1] + shadow_offset_y))
+        draws.append((shadow, (pixel[0] + shadow_offset_x, pixel[1] + shadow_offset_y)))
 
         if idx == 0:
-            direction_index = DIRECTION_TO_INDEX.get(current_direction, DIRECTION_TO_INDEX[RIGHT])
-            surface.blit(head_frames[direction_index], pixel)
+            direction_index = direction_to_index.get(current_direction, default_index)
+            draws.append((head_frames[direction_index], pixel))
             continue
 
         # New theme: 등 뒤 친구는 각자 'head' 스프라이트로 표시한다.
-        if friend_head_frames and friend_kinds and idx - 1 < len(friend_kinds):
+        if idx - 1 < friend_count:
             kind = friend_kinds[idx - 1]
             prev_segment = snake[idx - 1]
             seg_dir = direction_between(segment, prev_segment)
-            direction_index = DIRECTION_TO_INDEX.get(seg_dir, DIRECTION_TO_INDEX[RIGHT])
-            if 0 <= kind < len(friend_head_frames):
-                surface.blit(friend_head_frames[kind][direction_index], pixel)
+            direction_index = direction_to_index.get(seg_dir, default_index)
+            if 0 <= kind < friend_sheet_count:
+                draws.append((friend_head_frames[kind][direction_index], pixel))
                 continue
 
-        if idx == len(snake) - 1:
+        if idx == last_idx:
             prev_segment = snake[idx - 1]
             tail_direction = direction_between(segment, prev_segment)
-            direction_index = DIRECTION_TO_INDEX.get(tail_direction, DIRECTION_TO_INDEX[RIGHT])
+            direction_index = direction_to_index.get(tail_direction, default_index)
             # New friend-theme uses non-directional tail sprites; legacy uses directional sheets.
-            if len(tail_frames) >= 4:
-                surface.blit(tail_frames[direction_index], pixel)
+            if directional_tail:
+                draws.append((tail_frames[direction_index], pixel))
             else:
-                surface.blit(tail_frames[idx % len(tail_frames)], pixel)
+                draws.append((tail_frames[idx % len(tail_frames)], pixel))
             continue
 
         prev_segment = snake[idx - 1]
         next_segment = snake[idx + 1]
         frame_idx = body_frame_index(prev_segment, segment, next_segment)
         # New friend-theme uses a small set of variants; legacy uses indexed frames.
-        if len(body_frames) >= 6:
-            surface.blit(body_frames[frame_idx], pixel)
+        if directional_body:
+            draws.append((body_frames[frame_idx], pixel))
         else:
-            surface.blit(body_frames[idx % len(body_frames)], pixel)
+            draws.append((body_frames[idx % len(body_frames)], pixel))
+
+    surface.blits(draws, doreturn=False)
 
 
 def draw_food(
@@ -338,6 +386,9 @@ def draw_food(
     surface.blit(frame, pixel)
 
 
+_hud_panel_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+
+
 def draw_hud(
     surface: pygame.Surface,
     hud_panel: pygame.Surface,
@@ -352,40 +403,23 @@ def draw_hud(
     panel_margin = 24
     panel_rect = pygame.Rect(panel_margin, 10, SCREEN_WIDTH - panel_margin * 2, 44)
 
-    panel = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
-    pygame.draw.rect(panel, (255, 255, 255, 165), panel.get_rect(), border_radius=18)
-    pygame.draw.rect(panel, (30, 30, 30, 90), panel.get_rect(), width=2, border_radius=18)
+    # 패널 배경은 바뀌지 않으므로 크기별로 한 번만 그려 두고, 매 프레임엔 글자만 새로 올린다.
+    panel = _hud_panel_cache.get(panel_rect.size)
+    if panel is None:
+        panel = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(panel, (255, 255, 255, 165), panel.get_rect(), border_radius=18)
+        pygame.draw.rect(panel, (30, 30, 30, 90), panel.get_rect(), width=2, border_radius=18)
+        panel = panel.convert_alpha()
+        _hud_panel_cache[panel_rect.size] = panel
     surface.blit(panel, panel_rect.topleft)
 
-    left_text = font.render(f"친구 수: {score}", True, (30, 30, 30))
-    right_text = font.render(f"속도: {speed:.1f}/s", True, (30, 30, 30))
+    left_text = render_text(font, f"친구 수: {score}", (30, 30, 30))
+    right_text = render_text(font, f"속도: {speed:.1f}/s", (30, 30, 30))
 
     surface.blit(left_text, (panel_rect.x + 18, panel_rect.y + 12))
     surface.blit(right_text, (panel_rect.right - right_text.get_width() - 18, panel_rect.y + 12))
 
 
-def draw_game_over(
-    surface: pygame.Surface, font: pygame.font.Font, score: int, card_surface: pygame.Surface
-) -> None:
-    """Draw the game-over overlay card with status text."""
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 170))
-    surface.blit(overlay, (0, 0))
-
-    card_rect = card_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-    surface.blit(card_surface, card_rect)
-
-    lines = [
-        "게임 오버!",
-        f"구한 친구 수: {score}",
-        "R: 다시 시작 | ESC: 종료",
-    ]
-    for idx, text in enumerate(lines):
-        rendered = font.render(text, True, TEXT_COLOR)
-        text_rect = rendered.get_rect(center=(card_rect.centerx, card_rect.top + 50 + idx * 32))
-        surface.blit(rendered, text_rect)
-
-
 def update_sparks(effects: List[SparkEffect], delta_time: float, total_frames: int) -> None:
     """Advance spark animations and remove finished instances."""
     for effect in effects[:]:
@@ -486,6 +520,9 @@ def run_game(*, quit_on_exit: bool = True) -> None:
     mode: str = "title"  # title | howto | play
 
     snake: List[Point] = []
+    # 몸통 충돌 판정용 점유 격자(1칸 = 1바이트, 인덱스 y * GRID_WIDTH + x).
+    # `new_head in snake`처럼 리스트 전체를 훑지 않고 한 번의 인덱싱으로 판정한다.
+    occupied = bytearray(GRID_WIDTH * GRID_HEIGHT)
     # head(플레이어) 뒤에 붙는 친구 종류(0..3): blue/default/red/yell
     friend_kinds: List[int] = []
     current_direction: Direction = (1, 0)
@@ -501,6 +538,8 @@ def run_game(*, quit_on_exit: bool = True) -> None:
     def reset_play() -> None:
         nonlocal snake, current_direction, friend_pos, friend_kind, move_timer, moves_per_second, score, game_over
         snake = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
+        occupied[:] = bytes(len(occupied))
+        occupied[snake[0][1] * GRID_WIDTH + snake[0][0]] = 1
         friend_kinds.clear()
         current_direction = (1, 0)
         direction_queue.clear()
@@ -519,6 +558,9 @@ def run_game(*, quit_on_exit: bool = True) -> None:
 
     running = True
     prev_game_over = False
+    # 타이틀/게임방법 화면은 (모드, 선택 메뉴)가 같으면 그림도 같으므로,
+    # 마지막으로 그린 조합을 기억해 두고 바뀌지 않았으면 다시 그리거나 flip하지 않는다.
+    drawn_screen: Optional[Tuple[str, int]] = None
     while running:
         delta_ms = clock.tick(60)
         delta_time = delta_ms / 1000
@@ -527,6 +569,9 @@ def run_game(*, quit_on_exit: bool = True) -> None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                # 창이 가려졌다 다시 보이면 정적 화면도 다시 그린다.
+                drawn_screen = None
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
@@ -592,18 +637,17 @@ def run_game(*, quit_on_exit: bool = True) -> None:
                 move_timer -= move_interval
                 current_direction = next_direction(current_direction, direction_queue)
                 head_x, head_y = snake[0]
-                new_head = (head_x + current_direction[0], head_y + current_direction[1])
-
-                if (
-                    new_head[0] < 0
-                    or new_head[0] >= GRID_WIDTH
-                    or new_head[1] < 0
-                    or new_head[1] >= GRID_HEIGHT
-                    or new_head in snake
-                ):
+                new_x = head_x + current_direction[0]
+                new_y = head_y + current_direction[1]
+                new_head = (new_x, new_y)
+                # 점유 격자 인덱스는 벽 판정(범위 검사)을 통과했을 때만 읽는다.
+                new_cell = new_y * GRID_WIDTH + new_x
+
+                if not (0 <= new_x < GRID_WIDTH and 0 <= new_y < GRID_HEIGHT) or occupied[new_cell]:
                     game_over = True
                 else:
                     snake.insert(0, new_head)
+                    occupied[new_cell] = 1
                     if new_head == friend_pos:
                         score += 1
                         moves_per_second += SPEED_INCREMENT
@@ -621,7 +665,8 @@ def run_game(*, quit_on_exit: bool = True) -> None:
                         )
                         sparks.append(SparkEffect(center=center))
                     else:
-                        snake.pop()
+                        tail_x, tail_y = snake.pop()
+                        occupied[tail_y * GRID_WIDTH + tail_x] = 0
 
         # 게임오버 "진입 순간"에만: BGM pause + 부저음 1회
         if mode == "play" and game_over and not prev_game_over:
@@ -637,24 +682,31 @@ def run_game(*, quit_on_exit: bool = True) -> None:
                     pass
         prev_game_over = (mode == "play") and game_over
 
+        if mode != "play":
+            if (mode, menu_index) == drawn_screen:
+                continue
+            drawn_screen = (mode, menu_index)
+        else:
+            drawn_screen = None
+
         if mode == "title":
             draw_background(screen, assets.background_tile, assets.grid_overlay)
-            title_surf = font_title.render("모아부리", True, (20, 20, 20))
+            title_surf = render_text(font_title, "모아부리", (20, 20, 20))
             # 세 게임 공통 타이틀 레이아웃(글씨↔버튼 간격 통일)
             screen.blit(title_surf, title_surf.get_rect(center=(SCREEN_WIDTH // 2, 150)))
-            subtitle = font.render("친구들을 모아서 구출하자!", True, (60, 60, 60))
+            subtitle = render_text(font, "친구들을 모아서 구출하자!", (60, 60, 60))
             screen.blit(subtitle, subtitle.get_rect(center=(SCREEN_WIDTH // 2, 195)))
             for idx, (rect, label) in enumerate([(btn_start, "게임시작"), (btn_howto, "게임방법")]):
                 draw_card(screen, rect)
                 color = (20, 20, 20) if idx == menu_index else (90, 90, 90)
-                t = font.render(label, True, color)
+                t = render_text(font, label, color)
                 screen.blit(t, t.get_rect(center=rect.center))
-            esc = font_small.render("ESC: 종료", True, (70, 70, 70))
+            esc = render_text(font_small, "ESC: 종료", (70, 70, 70))
             # 다른 게임과 동일하게 하단 중앙에 안내 문구 배치
             screen.blit(esc, esc.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 26)))
         elif mode == "howto":
             draw_background(screen, assets.background_tile, assets.grid_overlay)
-            title_surf = font_title.render("게임방법", True, (20, 20, 20))
+            title_surf = render_text(font_title, "게임방법", (20, 20, 20))
             screen.blit(title_surf, title_surf.get_rect(center=(SCREEN_WIDTH // 2, 120)))
             card = pygame.Rect((SCREEN_WIDTH - 520) // 2, 170, 520, 240)
             draw_card(screen, card)
@@ -670,11 +722,11 @@ def run_game(*, quit_on_exit: bool = True) -> None:
                 if line == "":
                     y += 12
                     continue
-                surf = font.render(line, True, (50, 50, 50))
+                surf = render_text(font, line, (50, 50, 50))
                 screen.blit(surf, surf.get_rect(center=(card.centerx, y)))
                 y += 30
             draw_card(screen, btn_back)
-            back = font.render("뒤로", True, (20, 20, 20))
+            back = render_text(font, "뒤로", (20, 20, 20))
             screen.blit(back, back.get_rect(center=btn_back.center))
         else:
             draw_background(screen, assets.background_tile, assets.grid_overlay)
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import math
+import operator
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from enum import IntEnum
 from pathlib import Path
 from typing import Optional, Tuple
 
 import pygame
 
-from ui_common import draw_game_over_ui
+from ui_common import draw_game_over_ui, render_text
 
 # =========================
 # 기본 설정
@@ -50,16 +54,27 @@ CARRIER_SPEED_RAMP_MULT = 1.6
 # 캐리어(요정) 좌우 이동 폭(왕복 거리). 기존엔 화면 거의 전체를 쓰는데 너무 넓어 보여 축소.
 # 예) 약 580px 느낌 → 300px 정도로 제한
 CARRIER_TRAVEL_WIDTH = 300
+# 위 이동 폭을 화면 중앙 기준 좌우 한계(x)로 미리 환산해 둔다(가장자리 여백 12px 보장).
+CARRIER_EDGE_MARGIN = 12
+CARRIER_MIN_X = max(CARRIER_EDGE_MARGIN, int((SCREEN_WIDTH - CUBE_SIZE) / 2 - CARRIER_TRAVEL_WIDTH / 2))
+CARRIER_MAX_X = min(SCREEN_WIDTH - CUBE_SIZE - CARRIER_EDGE_MARGIN, int((SCREEN_WIDTH - CUBE_SIZE) / 2 + CARRIER_TRAVEL_WIDTH / 2))
 
 # 안정도(세미-물리) 튜닝
 MIN_OVERLAP_RATIO_FOR_SAFE = 0.62  # 이 이상이면 거의 흔들림 없이 안정
 MIN_OVERLAP_RATIO_TO_PLACE = 0.20  # 이 미만이면 사실상 지지 불가 -> 즉시 붕괴
+# 큐브 폭이 모두 같으므로 위 비율은 “x 차이(px)” 한계로 바꿔 정수 비교로 판정할 수 있다.
+MAX_PLACE_OFFSET_PX = CUBE_SIZE * (1.0 - MIN_OVERLAP_RATIO_TO_PLACE)
+# 불안정 증가량 보간 구간(TO_PLACE ~ FOR_SAFE)의 폭
+OVERLAP_UNSAFE_SPAN = max(1e-6, MIN_OVERLAP_RATIO_FOR_SAFE - MIN_OVERLAP_RATIO_TO_PLACE)
 INSTABILITY_GAIN_MAX = 2.8
 INSTABILITY_DECAY_PER_SEC = 1.4
 TILT_GROWTH_PER_SEC = 1.25
 # 기존 값(18도)은 시각적으로는 거의 안 기울어 보여도 게임오버가 나기 쉬웠다.
 # 체감과 일치하도록 임계값을 조금 완화한다.
 TILT_THRESHOLD_DEG = 28.0  # 탑이 중심을 잃는 기준(각도)
+# 기울기 시각화: 위로 한 층 갈 때마다 x를 tan(각도) * 이 값(px)만큼 민다.
+# 이전 값(2.0)은 기울기가 누적돼도 거의 안 보였다 → 체감과 판정 불일치.
+TILT_SHIFT_PX_PER_LEVEL = 8.0
 
 # “정확히 쌓았다” 체감을 살리기 위한 스냅(몇 px 이내면 자동 정렬)
 SNAP_TO_TARGET_PX = 4
@@ -98,22 +113,42 @@ def get_font(size: int, bold: bool = False) -> pygame.font.Font:
 
 
 def draw_text_center(surface: pygame.Surface, font: pygame.font.Font, text: str, y: int, color=TEXT_COLOR) -> None:
-    rendered = font.render(text, True, color)
+    rendered = render_text(font, text, color)
     rect = rendered.get_rect(center=(SCREEN_WIDTH // 2, y))
     surface.blit(rendered, rect)
 
 
+# 카드 그림자는 크기(w, h)만 같으면 모양이 같으므로 한 번 만들어 재사용한다.
+_card_shadow_cache: dict[tuple[int, int], pygame.Surface] = {}
+
+
 def draw_card(surface: pygame.Surface, rect: pygame.Rect) -> None:
-    shadow = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
-    pygame.draw.rect(shadow, SHADOW, shadow.get_rect(), border_radius=18)
+    key = (rect.width, rect.height)
+    shadow = _card_shadow_cache.get(key)
+    if shadow is None:
+        shadow = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
+        pygame.draw.rect(shadow, SHADOW, shadow.get_rect(), border_radius=18)
+        shadow = shadow.convert_alpha()
+        _card_shadow_cache[key] = shadow
     surface.blit(shadow, (rect.x - 5, rect.y + 6))
     pygame.draw.rect(surface, (255, 255, 255), rect, border_radius=18)
     pygame.draw.rect(surface, (40, 40, 40), rect, width=2, border_radius=18)
 
 
-@dataclass
+class GameState(IntEnum):
+    """화면 상태. 값은 상태별 렌더링 함수 튜플의 인덱스로도 쓰인다."""
+
+    TITLE = 0
+    HOWTO = 1
+    PLAY = 2
+    GAMEOVER = 3
+
+
+@dataclass(slots=True)
 class Cube:
-    rect: pygame.Rect
+    # 크기는 항상 CUBE_SIZE라 좌상단 월드 좌표(px)만 들고, Rect는 만들지 않는다.
+    x: int
+    y: int
     is_falling: bool = False
     vel_y: float = 0.0
     kind: int = 0
@@ -122,7 +157,7 @@ class Cube:
         if not self.is_falling:
             return
         self.vel_y += GRAVITY * dt
-        self.rect.y += int(self.vel_y * dt)
+        self.y += int(self.vel_y * dt)
 
 
 class SugarStackGame:
@@ -137,6 +172,10 @@ class SugarStackGame:
         self.font = get_font(22)
         self.font_small = get_font(18)
 
+        # 타이틀/게임방법 화면은 완전히 정적이라 처음 그린 결과를 통째로 보관해 두고 blit만 한다.
+        self._title_screen: Optional[pygame.Surface] = None
+        self._howto_screen: Optional[pygame.Surface] = None
+
         # SFX: 햄버거를 놓을 때마다 재생
         self.sfx_pop: Optional[pygame.mixer.Sound] = None
         # SFX: 게임오버 시 재생(+ BGM pause)
@@ -144,7 +183,7 @@ class SugarStackGame:
         self._bgm_paused_for_gameover = False
         self._init_sfx()
 
-        self.state: str = "title"  # title | howto | play | gameover
+        self.state = GameState.TITLE
         self.running = True
 
         # New theme assets (쌓아부리)
@@ -154,10 +193,16 @@ class SugarStackGame:
         self.food_surfaces: list[pygame.Surface] = []
         # 요정(햄버거를 “들고 있는” 연출용 오버레이 스프라이트)
         self.fairy_frames: list[pygame.Surface] = []
+        # 에셋이 없을 때 쓰는 도형 큐브: 색상별로 한 번만 그려두고 blit으로 재사용
+        self._cube_surface_cache: dict[Tuple[int, int, int], pygame.Surface] = {}
         # 드롭 순간 요정이 “그 자리에 가만히” 있도록, 스크린 기준 x를 고정(freeze)하기 위한 상태
         self._fairy_frozen: bool = False
         self._fairy_anchor_center_x: int = SCREEN_WIDTH // 2
         self._load_assets()
+        # 배경/접시(베이스)는 정적이라 매 프레임 도형을 그리지 않고 미리 만들어 둔 surface를 blit한다.
+        self._background_surface = self._build_background_surface()
+        self._base_surface = self._build_base_surface()
+        self._carrier_surface = self._build_carrier_surface()
 
         # UI 버튼(가로 화면 기준)
         btn_w, btn_h = 240, 62
@@ -166,6 +211,27 @@ class SugarStackGame:
         self.btn_howto = pygame.Rect(btn_x, 378, btn_w, btn_h)
         self.btn_back = pygame.Rect(26, 22, 110, 46)
 
+        # 상태별 렌더링 함수 테이블(매 프레임 if/elif 대신 GameState 값으로 바로 인덱싱)
+        self._draw_by_state = (
+            self.draw_title,
+            self.draw_howto,
+            self.draw_play,
+            self.draw_gameover,
+        )
+        # 입력도 같은 방식으로 상태별 핸들러 테이블에서 바로 꺼내 쓴다.
+        self._key_by_state = (
+            self._on_key_title,
+            self._on_key_howto,
+            self._on_key_play,
+            self._on_key_gameover,
+        )
+        self._click_by_state = (
+            self._on_click_title,
+            self._on_click_howto,
+            self._on_click_play,
+            self._on_click_gameover,
+        )
+
         self.reset_game()
 
     def _init_sfx(self) -> None:
@@ -184,9 +250,19 @@ class SugarStackGame:
             self.sfx_pop = None
             self.sfx_gameover = None
 
+    def _update_carrier_limits(self) -> None:
+        # 가속도/속도 상한은 level에만 의존하므로, level이 바뀔 때(리셋/착지)만 다시 계산한다.
+        level_factor = max(0.0, (self.level - 1) * CARRIER_SPEED_RAMP_MULT)
+        self._carrier_accel = CARRIER_ACCEL_BASE + CARRIER_ACCEL_PER_LEVEL * level_factor
+        self._carrier_max_speed = CARRIER_MAX_SPEED_BASE + CARRIER_MAX_SPEED_PER_LEVEL * level_factor
+
+    def _update_tilt_shift(self) -> None:
+        self._tilt_shift_per_level = math.tan(math.radians(self.tilt_deg)) * TILT_SHIFT_PX_PER_LEVEL
+
     def _enter_gameover(self, reason: str) -> None:
         """게임오버 진입: BGM을 멈추고(일시정지) 효과음을 1회 재생한다."""
         self.game_over_reason = reason
+        self._gameover_backdrop = None
         if not self._bgm_paused_for_gameover:
             try:
                 if pygame.mixer.get_init() is not None and pygame.mixer.music.get_busy():
@@ -199,7 +275,7 @@ class SugarStackGame:
                 except Exception:
                     pass
             self._bgm_paused_for_gameover = True
-        self.state = "gameover"
+        self.state = GameState.GAMEOVER
 
     def _resume_bgm(self) -> None:
         """게임 재개 시 BGM을 다시 재생한다."""
@@ -217,7 +293,8 @@ class SugarStackGame:
             return
         try:
             bg = pygame.image.load((NEW_ASSET_DIR / "title_background_800_540.png").as_posix()).convert_alpha()
-            self.bg_surface = pygame.transform.smoothscale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            # 배경은 불투명이라 알파 없는 디스플레이 포맷으로 바꿔 두면 blit이 단순 복사가 된다.
+            self.bg_surface = pygame.transform.smoothscale(bg, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
 
             dish = pygame.image.load((NEW_ASSET_DIR / "game1_dish_45_32.png").as_posix()).convert_alpha()
             self.dish_surface = pygame.transform.smoothscale(dish, (BASE_WIDTH, BASE_HEIGHT))
@@ -254,28 +331,38 @@ class SugarStackGame:
     def reset_game(self) -> None:
         # 월드 좌표계의 카메라(스크린 상단이 바라보는 월드 y)
         # 시작 시엔 0으로 두어 월드=스크린처럼 보이게 한다.
-        self.camera_y = 0.0
+        # 카메라는 정수 좌표인 스택 최상단에만 맞춰 움직이므로 정수(px)로 들고 int() 변환을 없앤다.
+        self.camera_y = 0
 
         base_y = SCREEN_HEIGHT - 68
         base_x = (SCREEN_WIDTH - BASE_WIDTH) // 2
         self.base_rect = pygame.Rect(base_x, base_y, BASE_WIDTH, BASE_HEIGHT)
+        # 베이스는 움직이지 않으므로 COM 판정용 지지 구간도 리셋 때 한 번만 계산한다.
+        self._com_support_left = self.base_rect.left + COM_MARGIN_PX
+        self._com_support_right = self.base_rect.right - COM_MARGIN_PX
 
-        # “탑”은 배치된 큐브 리스트(아래→위)
+        # “탑”은 배치된 큐브들(아래→위)을 x/y/kind 병렬 배열로 보관한다.
+        # (큐브 크기는 모두 CUBE_SIZE라 Rect 없이 좌상단 좌표만 있으면 충분)
         first_cube_x = (SCREEN_WIDTH - CUBE_SIZE) // 2
         first_cube_y = self.base_rect.top - CUBE_SIZE
         first_kind = 0
         if self.food_surfaces:
             first_kind = int(pygame.time.get_ticks()) % len(self.food_surfaces)
-        self.stack: list[Cube] = [
-            Cube(pygame.Rect(first_cube_x, first_cube_y, CUBE_SIZE, CUBE_SIZE), is_falling=False, kind=first_kind)
-        ]
+        self.stack_x = array("i", [first_cube_x])
+        self.stack_y = array("i", [first_cube_y])
+        self.stack_kind = array("i", [first_kind])
+        # COM 계산용 x 합계: 큐브는 한 번 놓이면 움직이지 않으므로 append 때만 누적하면 된다.
+        self._stack_x_sum = first_cube_x
 
         self.level = 1
         self.score = 1  # 첫 큐브를 1층으로 취급
+        self._update_carrier_limits()
 
         # 불안정/기울기(세미-물리)
         self.instability = 0.0
         self.tilt_deg = 0.0
+        # draw_stack에서 쓰는 층당 x 밀림(px). update_play에서 tilt_deg가 바뀐 프레임에만 갱신한다.
+        self._tilt_shift_per_level = 0.0
 
         # 캐리어(요정) 이동 상태
         self.carrier_x = float((SCREEN_WIDTH - CUBE_SIZE) // 2)
@@ -287,7 +374,8 @@ class SugarStackGame:
         if self.food_surfaces:
             held_kind = (first_kind + 1) % len(self.food_surfaces)
         self.held_cube = Cube(
-            pygame.Rect(int(self.carrier_x), int(self.camera_y + HELD_CUBE_SCREEN_Y), CUBE_SIZE, CUBE_SIZE),
+            int(self.carrier_x),
+            self.camera_y + HELD_CUBE_SCREEN_Y,
             is_falling=False,
             kind=held_kind,
         )
@@ -296,24 +384,28 @@ class SugarStackGame:
         self._fairy_anchor_center_x = int(self.carrier_x) + CUBE_SIZE // 2
 
         self.game_over_reason: Optional[str] = None
+        # 게임오버 화면 뒤에 깔리는 “멈춘 탑” 장면. 게임오버 첫 프레임에 한 번만 그려 둔다.
+        self._gameover_backdrop: Optional[pygame.Surface] = None
 
     def spawn_held_cube(self) -> None:
         kind = 0
         if self.food_surfaces:
             kind = (pygame.time.get_ticks() // 110) % len(self.food_surfaces)
-        self.held_cube = Cube(
-            pygame.Rect(int(self.carrier_x), int(self.camera_y + HELD_CUBE_SCREEN_Y), CUBE_SIZE, CUBE_SIZE),
-            is_falling=False,
-            kind=int(kind),
-        )
+        # 착지한 큐브의 좌표/종류는 이미 스택 배열에 복사됐으므로, 새 객체를 만들지 않고 그대로 재사용한다.
+        held = self.held_cube
+        held.x = int(self.carrier_x)
+        held.y = self.camera_y + HELD_CUBE_SCREEN_Y
+        held.is_falling = False
+        held.vel_y = 0.0
+        held.kind = int(kind)
         # 새 햄버거를 집으면 요정은 다시 캐리어 위치를 따라간다.
         self._fairy_frozen = False
         self._fairy_anchor_center_x = int(self.carrier_x) + CUBE_SIZE // 2
 
     def update_camera(self) -> None:
         """스택 최상단이 화면 상단 쪽으로 침범하지 않도록 카메라를 위로 올린다."""
-        top_world_y = self.stack[-1].rect.top
-        desired_camera_y = float(top_world_y - STACK_TOP_MIN_SCREEN_Y)
+        top_world_y = self.stack_y[-1]
+        desired_camera_y = top_world_y - STACK_TOP_MIN_SCREEN_Y
         # 카메라는 위로만(= world y가 더 작은 방향) 이동: 즉, camera_y는 감소만 허용
         if desired_camera_y < self.camera_y:
             self.camera_y = desired_camera_y
@@ -322,7 +414,7 @@ class SugarStackGame:
     # 입력 처리
     # -------------------------
     def handle_drop_input(self) -> None:
-        if self.state != "play":
+        if self.state != GameState.PLAY:
             return
         if self.held_cube.is_falling:
             return
@@ -340,67 +432,71 @@ class SugarStackGame:
     # -------------------------
     # 전도/안정도 판정
     # -------------------------
-    def _compute_overlap_ratio(self, top_rect: pygame.Rect, falling_rect: pygame.Rect) -> float:
-        left = max(top_rect.left, falling_rect.left)
-        right = min(top_rect.right, falling_rect.right)
-        overlap = max(0, right - left)
-        return overlap / float(CUBE_SIZE)
-
     def _compute_center_of_mass_x(self) -> float:
         # 간단하게 모든 큐브의 중심 x 평균을 COM으로 사용(동일 질량 가정)
-        total = 0.0
-        for cube in self.stack:
-            total += cube.rect.centerx
-        return total / max(1, len(self.stack))
+        return self._stack_x_sum / max(1, len(self.stack_x)) + CUBE_SIZE / 2
 
     def _check_com_gameover(self) -> bool:
         com_x = self._compute_center_of_mass_x()
-        support_left = self.base_rect.left + COM_MARGIN_PX
-        support_right = self.base_rect.right - COM_MARGIN_PX
-        if com_x < support_left or com_x > support_right:
+        if com_x < self._com_support_left or com_x > self._com_support_right:
             self.game_over_reason = "중심을 잃고 쓰러졌어요!"
             return True
         return False
 
     def place_cube_if_landed(self) -> None:
-        if not self.held_cube.is_falling:
+        held = self.held_cube
+        if not held.is_falling:
             return
 
-        top = self.stack[-1].rect
+        # 착지 판정은 Rect 없이 정수 좌표만으로 한다(최상단 큐브 = 배열의 마지막 원소).
+        top_x = self.stack_x[-1]
+        top_y = self.stack_y[-1]
         # 상단에 닿았는지 체크
-        if self.held_cube.rect.bottom < top.top:
+        if held.y + CUBE_SIZE < top_y:
             return
 
         # 착지 처리(위에 얹기)
-        self.held_cube.rect.bottom = top.top
-        self.held_cube.is_falling = False
-        self.held_cube.vel_y = 0.0
+        held.y = top_y - CUBE_SIZE
+        held.is_falling = False
+        held.vel_y = 0.0
+
+        # 두 큐브의 폭이 같으므로 겹친 폭은 CUBE_SIZE - |x 차이|로 바로 구해진다.
+        offset = abs(held.x - top_x)
 
         # 사람이 보기엔 거의 딱 맞게 올렸다면 “스냅”으로 정확히 정렬해준다.
         # (고속 구간에서 int 반올림/프레임 타이밍으로 1~몇 px 어긋나는 문제 방지)
-        if abs(self.held_cube.rect.centerx - top.centerx) <= SNAP_TO_TARGET_PX:
-            self.held_cube.rect.centerx = top.centerx
+        if offset <= SNAP_TO_TARGET_PX:
+            held.x = top_x
+            offset = 0
 
-        overlap_ratio = self._compute_overlap_ratio(top, self.held_cube.rect)
-        if overlap_ratio <= 0.0:
+        # 실패 판정은 정수 비교로 먼저 걸러내고, 통과했을 때만 겹침 비율(float)을 계산한다.
+        if offset >= CUBE_SIZE:
             self._enter_gameover("재료가 떨어졌어요!")
             return
 
-        if overlap_ratio < MIN_OVERLAP_RATIO_TO_PLACE:
+        if offset > MAX_PLACE_OFFSET_PX:
             # 사실상 지지 불가 -> 즉시 붕괴(원작 감성: 너무 삐뚤면 바로 게임오버)
             self._enter_gameover("너무 삐뚤게 얹어서 무너졌어요!")
             return
 
+        overlap_ratio = (CUBE_SIZE - offset) / float(CUBE_SIZE)
+
         # 정상 배치
-        self.stack.append(Cube(self.held_cube.rect.copy(), is_falling=False, kind=self.held_cube.kind))
+        self.stack_x.append(held.x)
+        self.stack_y.append(held.y)
+        self.stack_kind.append(held.kind)
+        self._stack_x_sum += held.x
+        # 스택 최상단은 여기서만 바뀌므로 카메라도 이때만 갱신하면 된다.
+        self.update_camera()
         self.score += 1
         self.level = self.score
+        self._update_carrier_limits()
 
         # 오버랩이 작을수록 불안정 상승(세미-물리)
         if overlap_ratio >= MIN_OVERLAP_RATIO_FOR_SAFE:
             gain = 0.0
         else:
-            t = (MIN_OVERLAP_RATIO_FOR_SAFE - overlap_ratio) / max(1e-6, (MIN_OVERLAP_RATIO_FOR_SAFE - MIN_OVERLAP_RATIO_TO_PLACE))
+            t = (MIN_OVERLAP_RATIO_FOR_SAFE - overlap_ratio) / OVERLAP_UNSAFE_SPAN
             gain = min(INSTABILITY_GAIN_MAX, 0.6 + 2.2 * t)
         self.instability = min(6.0, self.instability + gain)
 
@@ -417,47 +513,53 @@ class SugarStackGame:
     # -------------------------
     def update_play(self, dt: float) -> None:
         # 캐리어 이동(가속 + 속도 상한)
-        level_factor = max(0.0, (self.level - 1) * CARRIER_SPEED_RAMP_MULT)
-        accel = CARRIER_ACCEL_BASE + CARRIER_ACCEL_PER_LEVEL * level_factor
-        max_speed = CARRIER_MAX_SPEED_BASE + CARRIER_MAX_SPEED_PER_LEVEL * level_factor
+        accel = self._carrier_accel
+        max_speed = self._carrier_max_speed
 
-        self.carrier_speed = min(max_speed, self.carrier_speed + accel * dt)
-        self.carrier_x += self.carrier_dir * self.carrier_speed * dt
+        # 프레임마다 도는 경로라 min/max 호출 대신 비교로 상한을 건다.
+        # 속도/위치는 지역 변수로 적분하고 self에는 마지막에 한 번만 써 넣는다.
+        speed = self.carrier_speed + accel * dt
+        if speed > max_speed:
+            speed = max_speed
+        carrier_x = self.carrier_x + self.carrier_dir * speed * dt
 
         # 좌우 이동 범위를 화면 중앙 기준으로 제한
-        margin = 12
-        center_x = (SCREEN_WIDTH - CUBE_SIZE) / 2
-        half = CARRIER_TRAVEL_WIDTH / 2
-        left_bound = max(margin, int(center_x - half))
-        right_bound = min(SCREEN_WIDTH - CUBE_SIZE - margin, int(center_x + half))
-        if self.carrier_x <= left_bound:
-            self.carrier_x = float(left_bound)
+        if carrier_x <= CARRIER_MIN_X:
+            carrier_x = float(CARRIER_MIN_X)
             self.carrier_dir = 1
-            self.carrier_speed = 0.0
-        elif self.carrier_x >= right_bound:
-            self.carrier_x = float(right_bound)
+            speed = 0.0
+        elif carrier_x >= CARRIER_MAX_X:
+            carrier_x = float(CARRIER_MAX_X)
             self.carrier_dir = -1
-            self.carrier_speed = 0.0
+            speed = 0.0
+        self.carrier_x = carrier_x
+        self.carrier_speed = speed
 
         # 들고 있는 큐브는 캐리어 위치를 따라감(낙하 중이면 제외)
-        if not self.held_cube.is_falling:
-            self.held_cube.rect.x = int(self.carrier_x)
+        held = self.held_cube
+        if not held.is_falling:
+            held.x = int(carrier_x)
             # 카메라가 움직여도 요정/큐브는 화면 상단 근처에 고정되도록 월드 y를 재설정
-            self.held_cube.rect.y = int(self.camera_y + HELD_CUBE_SCREEN_Y)
+            held.y = self.camera_y + HELD_CUBE_SCREEN_Y
             # 요정도 기본적으로 캐리어 위치를 따라가되, 드롭으로 고정된 동안엔 유지
             if not self._fairy_frozen:
-                self._fairy_anchor_center_x = int(self.carrier_x) + CUBE_SIZE // 2
-
-        # 낙하 업데이트
-        self.held_cube.update(dt)
-        self.place_cube_if_landed()
+                self._fairy_anchor_center_x = held.x + CUBE_SIZE // 2
+        else:
+            # 낙하 업데이트(들고 있는 동안엔 적분/착지 판정 자체를 건너뛴다)
+            held.update(dt)
+            self.place_cube_if_landed()
 
         # 불안정/기울기(프레임 기반)
+        # 층당 x 밀림은 tilt_deg가 실제로 바뀐 프레임에서만 다시 계산한다(똑바로 선 탑은 계산 자체를 건너뜀).
         if self.instability > 0:
             self.tilt_deg += TILT_GROWTH_PER_SEC * self.instability * dt
-            self.instability = max(0.0, self.instability - INSTABILITY_DECAY_PER_SEC * dt)
-        else:
-            self.tilt_deg = max(0.0, self.tilt_deg - 0.8 * dt)
+            instability = self.instability - INSTABILITY_DECAY_PER_SEC * dt
+            self.instability = instability if instability > 0.0 else 0.0
+            self._update_tilt_shift()
+        elif self.tilt_deg > 0.0:
+            tilt = self.tilt_deg - 0.8 * dt
+            self.tilt_deg = tilt if tilt > 0.0 else 0.0
+            self._update_tilt_shift()
 
         if self.tilt_deg >= TILT_THRESHOLD_DEG:
             self._enter_gameover("중심을 잃고 쓰러졌어요!")
@@ -467,92 +569,127 @@ class SugarStackGame:
         # 카메라가 위로 스크롤되면 오래된 아래 블록들은 화면 밖(아래)로 사라지는 게 정상이다.
         # 따라서 "스택 블록이 화면 아래로 내려갔다"는 조건으로 게임오버를 내면 오작동한다.
         # 대신, 낙하 중인 블록이 화면 아래로 완전히 떨어져 나가는 경우만 실패로 처리한다.
-        if self.held_cube.is_falling and self.held_cube.rect.top > int(self.camera_y + SCREEN_HEIGHT + 80):
+        if self.held_cube.is_falling and self.held_cube.y > self.camera_y + SCREEN_HEIGHT + 80:
             self._enter_gameover("재료가 떨어졌어요!")
             return
 
-        # 스택이 높아지면 카메라를 위로 올려 “항상 화면 하단 쪽에서 쌓이는” 느낌을 유지
-        self.update_camera()
-
     # -------------------------
     # 렌더링
     # -------------------------
     def draw_background(self) -> None:
+        self.screen.blit(self._background_surface, (0, 0))
+
+    def _build_background_surface(self) -> pygame.Surface:
         if self.use_new_assets and self.bg_surface is not None:
-            self.screen.blit(self.bg_surface, (0, 0))
-            return
+            return self.bg_surface
 
-        self.screen.fill(BG_COLOR)
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        surface.fill(BG_COLOR)
         # 간단한 구름 느낌
-        pygame.draw.circle(self.screen, (235, 248, 255), (70, 70), 28)
-        pygame.draw.circle(self.screen, (235, 248, 255), (100, 62), 22)
-        pygame.draw.circle(self.screen, (235, 248, 255), (125, 74), 18)
-        pygame.draw.circle(self.screen, (235, 248, 255), (305, 90), 26)
-        pygame.draw.circle(self.screen, (235, 248, 255), (330, 78), 20)
+        pygame.draw.circle(surface, (235, 248, 255), (70, 70), 28)
+        pygame.draw.circle(surface, (235, 248, 255), (100, 62), 22)
+        pygame.draw.circle(surface, (235, 248, 255), (125, 74), 18)
+        pygame.draw.circle(surface, (235, 248, 255), (305, 90), 26)
+        pygame.draw.circle(surface, (235, 248, 255), (330, 78), 20)
+        return surface
 
     def draw_base(self) -> None:
-        rect = self.base_rect.move(0, -int(self.camera_y))
-        if self.use_new_assets and self.dish_surface is not None:
-            self.screen.blit(self.dish_surface, rect.topleft)
-            return
-        pygame.draw.rect(self.screen, (220, 190, 140), rect, border_radius=10)
-        pygame.draw.rect(self.screen, (80, 60, 40), rect, width=2, border_radius=10)
+        self.screen.blit(self._base_surface, (self.base_rect.x, self.base_rect.y - self.camera_y))
 
-    def draw_cube(self, rect: pygame.Rect, shade: Tuple[int, int, int], *, kind: int = 0) -> None:
+    def _build_base_surface(self) -> pygame.Surface:
+        if self.use_new_assets and self.dish_surface is not None:
+            return self.dish_surface
+        surface = pygame.Surface((BASE_WIDTH, BASE_HEIGHT), pygame.SRCALPHA)
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, (220, 190, 140), rect, border_radius=10)
+        pygame.draw.rect(surface, (80, 60, 40), rect, width=2, border_radius=10)
+        return surface.convert_alpha()
+
+    def _cube_surface_for(self, shade: Tuple[int, int, int], kind: int) -> pygame.Surface:
         if self.use_new_assets and self.food_surfaces:
-            surface = self.food_surfaces[kind % len(self.food_surfaces)]
-            self.screen.blit(surface, rect.topleft)
-            return
-
-        pygame.draw.rect(self.screen, shade, rect, border_radius=8)
-        pygame.draw.rect(self.screen, (70, 70, 70), rect, width=2, border_radius=8)
+            return self.food_surfaces[kind % len(self.food_surfaces)]
+        return self._get_cube_surface(shade)
+
+    def _get_cube_surface(self, shade: Tuple[int, int, int]) -> pygame.Surface:
+        """도형 큐브(채움+테두리+하이라이트)를 색상별로 캐싱해 반환한다."""
+        cached = self._cube_surface_cache.get(shade)
+        if cached is not None:
+            return cached
+        surface = pygame.Surface((CUBE_SIZE, CUBE_SIZE), pygame.SRCALPHA)
+        rect = surface.get_rect()
+        pygame.draw.rect(surface, shade, rect, border_radius=8)
+        pygame.draw.rect(surface, (70, 70, 70), rect, width=2, border_radius=8)
         # 하이라이트
         hl = pygame.Rect(rect.x + 8, rect.y + 8, rect.width - 16, 10)
-        pygame.draw.rect(self.screen, (255, 255, 255), hl, border_radius=6)
+        pygame.draw.rect(surface, (255, 255, 255), hl, border_radius=6)
+        surface = surface.convert_alpha()
+        self._cube_surface_cache[shade] = surface
+        return surface
 
     def draw_carrier(self) -> None:
         # 요정 스프라이트가 있으면, 오버레이로 그려서 “햄버거를 들고 있는” 연출을 만들기 때문에
         # 여기서는 도형 요정을 그리지 않는다(중복 방지).
         if self.fairy_frames:
             return
-        # “요정”을 간단한 원/날개로 표현
-        x = int(self.carrier_x) + CUBE_SIZE // 2
         # 요정은 스크린 기준 위치에 고정
-        y = CARRIER_SCREEN_Y
-        pygame.draw.circle(self.screen, (255, 220, 240), (x, y), 12)  # 얼굴
-        pygame.draw.circle(self.screen, (30, 30, 30), (x - 4, y - 2), 2)
-        pygame.draw.circle(self.screen, (30, 30, 30), (x + 4, y - 2), 2)
+        self.screen.blit(self._carrier_surface, (int(self.carrier_x) + CUBE_SIZE // 2 - 22, CARRIER_SCREEN_Y - 14))
+
+    def _build_carrier_surface(self) -> pygame.Surface:
+        # “요정”을 간단한 원/날개로 표현(모양이 고정이라 한 번만 그려 두고 위치만 바꿔 blit)
+        surface = pygame.Surface((44, 28), pygame.SRCALPHA)
+        x, y = 22, 14
+        pygame.draw.circle(surface, (255, 220, 240), (x, y), 12)  # 얼굴
+        pygame.draw.circle(surface, (30, 30, 30), (x - 4, y - 2), 2)
+        pygame.draw.circle(surface, (30, 30, 30), (x + 4, y - 2), 2)
         # 날개
-        pygame.draw.ellipse(self.screen, (210, 255, 230), pygame.Rect(x - 22, y - 14, 18, 22))
-        pygame.draw.ellipse(self.screen, (210, 255, 230), pygame.Rect(x + 4, y - 14, 18, 22))
+        pygame.draw.ellipse(surface, (210, 255, 230), pygame.Rect(x - 22, y - 14, 18, 22))
+        pygame.draw.ellipse(surface, (210, 255, 230), pygame.Rect(x + 4, y - 14, 18, 22))
+        return surface.convert_alpha()
 
     def draw_hud(self) -> None:
         # 중앙 큰 숫자(원작 감성: 층수=점수)
-        score_text = str(self.score)
-        rendered = self.font_big.render(score_text, True, (35, 35, 35))
+        # 점수는 착지할 때만 바뀌고 안내 문구는 고정이라 렌더링 결과를 캐시에서 꺼내 쓴다.
+        rendered = render_text(self.font_big, str(self.score), (35, 35, 35))
         rect = rendered.get_rect(center=(SCREEN_WIDTH // 2, 220))
         self.screen.blit(rendered, rect)
 
-        if self.state == "play":
+        if self.state == GameState.PLAY:
             hint = "스페이스/아무 키/클릭/터치: 떨어뜨리기"
-            self.screen.blit(self.font_small.render(hint, True, (40, 40, 40)), (14, 32))
+            self.screen.blit(render_text(self.font_small, hint, (40, 40, 40)), (14, 32))
 
     def draw_stack(self) -> None:
         # 단순하지만 “기울기 진행”을 시각화: 위로 갈수록 x를 조금씩 밀어 기울어진 느낌을 줌
-        tilt_rad = math.radians(self.tilt_deg)
-        # 이전 값(2.0)은 기울기가 누적돼도 거의 안 보였다 → 체감과 판정 불일치.
-        x_shift_per_level = math.tan(tilt_rad) * 8.0  # 픽셀 단위(더 잘 보이게)
-
-        for idx, cube in enumerate(self.stack):
-            shift = int(x_shift_per_level * idx)
-            rect_world = cube.rect.move(shift, 0)
-            rect_screen = rect_world.move(0, -int(self.camera_y))
-            self.draw_cube(rect_screen, (255, 255, 255), kind=cube.kind)
+        x_shift_per_level = self._tilt_shift_per_level  # 픽셀 단위(더 잘 보이게)
+
+        # 화면에 걸치는 구간만 그린다. stack_y는 위로 쌓일수록 작아지는(내림차순) 배열이라
+        # 이진 탐색으로 보이는 인덱스 범위를 바로 구할 수 있다. (기울기는 x만 밀기 때문에 y 판정에 영향 없음)
+        cam_y = self.camera_y
+        stack_x = self.stack_x
+        stack_y = self.stack_y
+        stack_kind = self.stack_kind
+        first = bisect_right(stack_y, -(cam_y + SCREEN_HEIGHT), key=operator.neg)
+        last = bisect_left(stack_y, -(cam_y - CUBE_SIZE), key=operator.neg)
+        # 큐브마다 blit을 부르지 않고 (surface, 좌표) 목록을 만들어 blits 한 번으로 그린다.
+        # (목록 순서 = 그리는 순서: 스택 → 들고 있는 큐브 → 요정)
+        # 반복마다 self 속성을 찾지 않도록 배열/스프라이트 목록은 지역 변수로 꺼내 둔다.
+        if self.use_new_assets and self.food_surfaces:
+            food = self.food_surfaces
+            n_food = len(food)
+            draws = [
+                (food[stack_kind[idx] % n_food], (stack_x[idx] + int(x_shift_per_level * idx), stack_y[idx] - cam_y))
+                for idx in range(first, last)
+            ]
+        else:
+            cube_surf = self._get_cube_surface((255, 255, 255))
+            draws = [
+                (cube_surf, (stack_x[idx] + int(x_shift_per_level * idx), stack_y[idx] - cam_y))
+                for idx in range(first, last)
+            ]
 
         # 낙하 중/대기 중인 큐브
-        if self.state == "play":
-            held_rect = self.held_cube.rect.move(0, -int(self.camera_y))
-            self.draw_cube(held_rect, (252, 252, 252), kind=self.held_cube.kind)
+        if self.state == GameState.PLAY:
+            held = self.held_cube
+            draws.append((self._cube_surface_for((252, 252, 252), held.kind), (held.x, held.y - cam_y)))
 
             # “햄버거를 들고 있는 요정” 연출: 햄버거를 먼저 그리고, 그 위에 요정을 겹쳐서(앞에) 렌더링
             # 낙하 시작 순간에 요정이 잠깐 사라지는 현상을 막기 위해, falling 상태에서도 계속 그린다.
@@ -560,12 +697,21 @@ class SugarStackGame:
                 fairy = self.fairy_frames[0]
                 # 손이 햄버거 위쪽에 걸린 것처럼 보이도록 약간 위에서 겹치게 배치
                 # (midbottom 앵커를 햄버거 상단 근처로 둔다)
+                # get_rect(midbottom=...)로 매 프레임 Rect를 만들지 않고 좌상단을 바로 계산한다.
                 anchor_x = self._fairy_anchor_center_x - 6
                 anchor_y = FAIRY_HOLD_ANCHOR_SCREEN_Y
-                fr = fairy.get_rect(midbottom=(anchor_x, anchor_y))
-                self.screen.blit(fairy, fr)
+                draws.append((fairy, (anchor_x - fairy.get_width() // 2, anchor_y - fairy.get_height())))
+
+        self.screen.blits(draws, doreturn=False)
 
     def draw_title(self) -> None:
+        if self._title_screen is None:
+            self._compose_title()
+            self._title_screen = self.screen.copy()
+            return
+        self.screen.blit(self._title_screen, (0, 0))
+
+    def _compose_title(self) -> None:
         self.draw_background()
         draw_text_center(self.screen, self.font_title, "쌓아부리", 150)
         draw_text_center(self.screen, self.font, "햄버거를 최대한 높게 쌓아보자!", 195, color=(60, 60, 60))
@@ -577,6 +723,13 @@ class SugarStackGame:
         draw_text_center(self.screen, self.font_small, "ESC: 종료", SCREEN_HEIGHT - 26, color=(70, 70, 70))
 
     def draw_howto(self) -> None:
+        if self._howto_screen is None:
+            self._compose_howto()
+            self._howto_screen = self.screen.copy()
+            return
+        self.screen.blit(self._howto_screen, (0, 0))
+
+    def _compose_howto(self) -> None:
         self.draw_background()
         draw_text_center(self.screen, self.font_title, "게임방법", 120)
 
@@ -595,12 +748,12 @@ class SugarStackGame:
             if line == "":
                 y += 12
                 continue
-            rendered = self.font.render(line, True, TEXT_COLOR)
+            rendered = render_text(self.font, line, TEXT_COLOR)
             self.screen.blit(rendered, rendered.get_rect(center=(card.centerx, y)))
             y += 30
 
         draw_card(self.screen, self.btn_back)
-        back = self.font.render("뒤로", True, TEXT_COLOR)
+        back = render_text(self.font, "뒤로", TEXT_COLOR)
         self.screen.blit(back, back.get_rect(center=self.btn_back.center))
 
     def draw_play(self) -> None:
@@ -611,6 +764,10 @@ class SugarStackGame:
         self.draw_hud()
 
     def draw_gameover(self) -> None:
+        # 게임오버 동안에는 탑도, 사유/점수 카드도 바뀌지 않으므로 완성된 화면 전체를 스냅샷으로 쓴다.
+        if self._gameover_backdrop is not None:
+            self.screen.blit(self._gameover_backdrop, (0, 0))
+            return
         self.draw_play()
         draw_game_over_ui(
             self.screen,
@@ -621,11 +778,64 @@ class SugarStackGame:
             score=self.score,
             hint="R: 재시작   ENTER: 타이틀",
         )
+        self._gameover_backdrop = self.screen.copy()
 
     # -------------------------
     # 메인 루프
     # -------------------------
+    def _start_play(self) -> None:
+        self.state = GameState.PLAY
+        self.reset_game()
+
+    def _on_key_title(self, key: int) -> None:
+        # 타이틀에서는 아무 키로 시작해도 UX가 좋아짐(원작: 아무키나 가능)
+        self._start_play()
+
+    def _on_key_howto(self, key: int) -> None:
+        if key in (pygame.K_RETURN, pygame.K_SPACE):
+            self.state = GameState.TITLE
+
+    def _on_key_play(self, key: int) -> None:
+        # 스페이스뿐 아니라 “아무 키”도 드롭
+        self.handle_drop_input()
+
+    def _on_key_gameover(self, key: int) -> None:
+        if key == pygame.K_r:
+            self._resume_bgm()
+            self._start_play()
+        elif key == pygame.K_RETURN:
+            self._resume_bgm()
+            self.state = GameState.TITLE
+
+    def _on_click_title(self, pos: Tuple[int, int]) -> None:
+        if self.btn_start.collidepoint(pos):
+            self._start_play()
+        elif self.btn_howto.collidepoint(pos):
+            self.state = GameState.HOWTO
+
+    def _on_click_howto(self, pos: Tuple[int, int]) -> None:
+        if self.btn_back.collidepoint(pos):
+            self.state = GameState.TITLE
+
+    def _on_click_play(self, pos: Tuple[int, int]) -> None:
+        self.handle_drop_input()
+
+    def _on_click_gameover(self, pos: Tuple[int, int]) -> None:
+        # 클릭으로도 빠른 재시작
+        self._resume_bgm()
+        self._start_play()
+
     def run(self, quit_on_exit: bool = True) -> None:
+        # 이 게임은 종료/키 입력/클릭만 처리하므로, 마우스 이동 같은 나머지 이벤트는
+        # 아예 큐에 쌓이지 않도록 SDL 단계에서 걸러낸다.
+        # (창이 가려졌다 다시 보일 때 정적 화면을 다시 그려야 하므로 WINDOWEXPOSED는 받는다.)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED])
+
+        # 타이틀/게임방법/게임오버 화면은 상태가 바뀌지 않는 한 그림이 같으므로,
+        # 마지막으로 그린 상태를 기억해 두고 PLAY가 아닐 때는 다시 그리거나 flip하지 않는다.
+        drawn_state: Optional[GameState] = None
+
         while self.running:
             dt_ms = self.clock.tick(FPS)
             dt = dt_ms / 1000.0
@@ -634,63 +844,28 @@ class SugarStackGame:
                 if event.type == pygame.QUIT:
                     self.running = False
 
+                if event.type == pygame.WINDOWEXPOSED:
+                    drawn_state = None
+
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.running = False
                         continue
-
-                    if self.state == "title":
-                        # 타이틀에서는 아무 키로 시작해도 UX가 좋아짐(원작: 아무키나 가능)
-                        self.state = "play"
-                        self.reset_game()
-                    elif self.state == "howto":
-                        if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                            self.state = "title"
-                    elif self.state == "play":
-                        # 스페이스뿐 아니라 “아무 키”도 드롭
-                        self.handle_drop_input()
-                    elif self.state == "gameover":
-                        if event.key == pygame.K_r:
-                            self._resume_bgm()
-                            self.state = "play"
-                            self.reset_game()
-                        elif event.key == pygame.K_RETURN:
-                            self._resume_bgm()
-                            self.state = "title"
+                    self._key_by_state[self.state](event.key)
 
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    mx, my = event.pos
-                    if self.state == "title":
-                        if self.btn_start.collidepoint(mx, my):
-                            self.state = "play"
-                            self.reset_game()
-                        elif self.btn_howto.collidepoint(mx, my):
-                            self.state = "howto"
-                    elif self.state == "howto":
-                        if self.btn_back.collidepoint(mx, my):
-                            self.state = "title"
-                    elif self.state == "play":
-                        self.handle_drop_input()
-                    elif self.state == "gameover":
-                        # 클릭으로도 빠른 재시작
-                        self._resume_bgm()
-                        self.state = "play"
-                        self.reset_game()
-
-            if self.state == "play":
-                self.update_play(dt)
+                    self._click_by_state[self.state](event.pos)
 
-            if self.state == "title":
-                self.draw_title()
-            elif self.state == "howto":
-                self.draw_howto()
-            elif self.state == "play":
-                self.draw_play()
-            elif self.state == "gameover":
-                self.draw_gameover()
+            if self.state == GameState.PLAY:
+                self.update_play(dt)
 
-            pygame.display.flip()
+            if self.state == GameState.PLAY or self.state != drawn_state:
+                self._draw_by_state[self.state]()
+                pygame.display.flip()
+                drawn_state = self.state
 
+        # 런처와 디스플레이/이벤트 큐를 공유하므로, 복귀 전에 이벤트 필터를 원래대로 되돌린다.
+        pygame.event.set_allowed(None)
         if quit_on_exit:
             pygame.quit()
 
@@ -3,16 +3,53 @@ from __future__ import annotations
 import pygame
 
 
+# 텍스트 렌더링(font.render)은 무거워서, 같은 (폰트, 문자열, 색) 조합은 한 번만 렌더링해 재사용한다.
+# 점수처럼 계속 바뀌는 문자열이 쌓이지 않도록 개수를 제한하고, 넘치면 가장 오래 쓰이지 않은 것(LRU)부터 버린다.
+# (dict는 삽입 순서를 유지하므로, 적중할 때마다 키를 맨 뒤로 다시 넣어 "최근 사용" 순서를 만든다.)
+_TEXT_CACHE_MAX = 256
+_text_cache: dict[tuple[pygame.font.Font, str, tuple[int, ...]], pygame.Surface] = {}
+
+
+def render_text(font: pygame.font.Font, text: str, color=(20, 20, 20)) -> pygame.Surface:
+    key = (font, text, tuple(color))
+    rendered = _text_cache.pop(key, None)
+    if rendered is None:
+        if len(_text_cache) >= _TEXT_CACHE_MAX:
+            del _text_cache[next(iter(_text_cache))]
+        rendered = font.render(text, True, color).convert_alpha()
+    _text_cache[key] = rendered
+    return rendered
+
+
+# 게임오버 화면은 매 프레임 오버레이를 깔기 때문에, 크기별로 검은 불투명 Surface를 한 번만 만들어 재사용한다.
+# (알파는 픽셀마다 두지 않고 set_alpha로 Surface 전체에 걸어, 알파값이 달라도 같은 Surface를 쓴다.)
+_overlay_cache: dict[tuple[int, int], pygame.Surface] = {}
+
+
 def draw_overlay(surface: pygame.Surface, *, alpha: int = 120) -> None:
-    overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, max(0, min(255, alpha))))
+    size = surface.get_size()
+    overlay = _overlay_cache.get(size)
+    if overlay is None:
+        overlay = pygame.Surface(size).convert()
+        overlay.fill((0, 0, 0))
+        _overlay_cache[size] = overlay
+    overlay.set_alpha(max(0, min(255, alpha)))
     surface.blit(overlay, (0, 0))
 
 
+# 카드 그림자는 크기별로 한 번만 만들어(디스플레이 포맷으로 변환) 재사용한다.
+_shadow_cache: dict[tuple[int, int], pygame.Surface] = {}
+
+
 def draw_card(surface: pygame.Surface, rect: pygame.Rect) -> None:
     # 쌓아부리 톤과 동일: 흰색 카드 + 검은 테두리 + 살짝 그림자
-    shadow = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
-    pygame.draw.rect(shadow, (0, 0, 0, 40), shadow.get_rect(), border_radius=18)
+    key = (rect.width, rect.height)
+    shadow = _shadow_cache.get(key)
+    if shadow is None:
+        shadow = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
+        pygame.draw.rect(shadow, (0, 0, 0, 40), shadow.get_rect(), border_radius=18)
+        shadow = shadow.convert_alpha()
+        _shadow_cache[key] = shadow
     surface.blit(shadow, (rect.x - 5, rect.y - 3))
 
     pygame.draw.rect(surface, (255, 255, 255), rect, border_radius=18)
@@ -20,7 +57,7 @@ def draw_card(surface: pygame.Surface, rect: pygame.Rect) -> None:
 
 
 def draw_text_center(surface: pygame.Surface, font: pygame.font.Font, text: str, y: int, *, color=(20, 20, 20)) -> None:
-    rendered = font.render(text, True, color)
+    rendered = render_text(font, text, color)
     rect = rendered.get_rect(center=(surface.get_width() // 2, y))
     surface.blit(rendered, rect)
 